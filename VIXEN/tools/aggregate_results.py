@@ -0,0 +1,894 @@
+#!/usr/bin/env python3
+"""
+Aggregate benchmark JSON results into normalized Excel workbook.
+
+Schema:
+- Benchmarks: One row per benchmark run (machine/GPU metadata)
+- Summary: Test statistics linked by benchmark_id
+- HW_RT_Frames, Compute_Frames, Fragment_Frames: Per-frame data by pipeline
+- Cross_Machine: Comparison across different machines/GPUs
+
+Directory Structure for Multi-Tester Data:
+    data/benchmarks/
+        benchmark_001/          <- Individual benchmark folders
+            *.json
+            debug_images/
+        benchmark_002/
+        benchmark_001.zip       <- Compressed archives for transport
+
+Usage:
+    python aggregate_results.py [--output PATH] [--cleanup]
+    python aggregate_results.py --pack benchmark_001    # Create ZIP from folder
+    python aggregate_results.py --unpack benchmark.zip  # Extract ZIP to folder
+    python aggregate_results.py --process-all           # Process all benchmarks in data/benchmarks/
+"""
+
+from __future__ import annotations
+
+import json
+import argparse
+import functools
+import uuid
+import os
+import shutil
+import socket
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from datetime import datetime
+
+import numpy as np
+
+from chart_config import PROJECT_ROOT, DATA_DIR, BENCHMARK_RESULTS_DIR, EXCEL_FILE
+
+# pandas and openpyxl are imported lazily inside the aggregation paths:
+# --list/--pack/--unpack don't touch them and shouldn't pay the ~400ms
+# import tax on every invocation.
+
+# orjson parses the many small per-test JSON files several times faster
+# than the stdlib; fall back to json when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Multi-tester benchmark directory
+BENCHMARKS_DIR = DATA_DIR / "benchmarks"
+
+# Already-compressed formats gain nothing from deflate - store them as-is
+STORED_SUFFIXES = {'.png', '.jpg', '.jpeg', '.zip'}
+
+# Pipeline name mapping for sheet names
+PIPELINE_SHEET_NAMES = {
+    'hardware_rt': 'HW_RT_Frames',
+    'compute': 'Compute_Frames',
+    'fragment': 'Fragment_Frames',
+}
+
+# Per-frame fields carried into the frame sheets, with compact dtypes
+FRAME_FIELDS = [
+    ('frame_num', np.int32),
+    ('frame_time_ms', np.float32),
+    ('fps', np.float32),
+    ('bandwidth_read_gbps', np.float32),
+    ('bandwidth_write_gbps', np.float32),
+    ('vram_mb', np.float32),
+    ('avg_voxels_per_ray', np.float32),
+    ('ray_throughput_mrays', np.float32),
+]
+
+
+@functools.lru_cache(maxsize=1)
+def get_machine_name() -> str:
+    """Get machine name from environment, config, or hostname.
+
+    Cached - the result cannot change within a run and the config probe
+    costs a file open plus a JSON parse.
+    """
+    # Check environment variable first
+    if 'VIXEN_MACHINE_NAME' in os.environ:
+        return os.environ['VIXEN_MACHINE_NAME']
+
+    # Check benchmark_config.json for machine_name
+    config_path = PROJECT_ROOT / 'application' / 'benchmark' / 'benchmark_config.json'
+    if config_path.exists():
+        try:
+            with open(config_path) as f:
+                config = json.load(f)
+                if 'suite' in config and config['suite'].get('machine_name'):
+                    return config['suite']['machine_name']
+        except (json.JSONDecodeError, IOError):
+            pass
+
+    # Fall back to hostname
+    return socket.gethostname()
+
+
+def generate_benchmark_id() -> str:
+    """Generate a unique benchmark ID."""
+    return str(uuid.uuid4())[:8]
+
+
+def _parse_json_bytes(raw: bytes) -> dict:
+    """Parse raw JSON bytes, preferring orjson's C parser when installed."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _frames_to_arrays(frames: list[dict]) -> dict[str, np.ndarray]:
+    """Project per-frame dicts into columnar NumPy arrays (SoA).
+
+    Only the fields the frame sheets need are kept; the per-frame dicts
+    are dropped right after parsing so large runs don't hold thousands of
+    dicts alive.
+    """
+    n = len(frames)
+    return {
+        name: np.fromiter((f.get(name, 0) for f in frames), dtype=dtype, count=n)
+        for name, dtype in FRAME_FIELDS
+    }
+
+
+def _load_one(json_file: Path) -> dict | None:
+    """Load and parse a single result file; None on failure."""
+    try:
+        data = _parse_json_bytes(json_file.read_bytes())
+        data['_source_file'] = json_file.name
+        if data.get('frames'):
+            data['frames'] = _frames_to_arrays(data['frames'])
+        return data
+    except (ValueError, IOError) as e:
+        # orjson.JSONDecodeError and json.JSONDecodeError are both ValueErrors
+        print(f"Warning: Could not load {json_file}: {e}")
+        return None
+
+
+def load_benchmark_results(results_dir: Path) -> list[dict]:
+    """Load all JSON benchmark results from directory.
+
+    Files are loaded on a thread pool: each parse is independent, the
+    open/read syscalls overlap, and orjson releases the GIL during its
+    C-level decode, so loading scales until the disk saturates.
+    """
+    json_files = sorted(results_dir.glob("*.json"))
+    print(f"Found {len(json_files)} JSON files in {results_dir}")
+
+    if not json_files:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(32, len(json_files))) as ex:
+        results = list(ex.map(_load_one, json_files))
+
+    return [r for r in results if r is not None]
+
+
+def extract_benchmark_metadata(results: list[dict], benchmark_id: str, machine_name: str) -> pd.DataFrame:
+    """Extract benchmark run metadata (one row per benchmark run)."""
+    import pandas as pd
+
+    if not results:
+        return pd.DataFrame()
+
+    # Get device info from first result (same for all in a run)
+    device = results[0].get('device', {})
+
+    # Find the earliest timestamp in one pass, no intermediate list
+    run_date = None
+    for r in results:
+        t = r.get('timestamp')
+        if t and (run_date is None or t < run_date):
+            run_date = t
+    if run_date is None:
+        run_date = datetime.now().isoformat()
+
+    row = {
+        'benchmark_id': benchmark_id,
+        'machine_name': machine_name,
+        'gpu_name': device.get('gpu', 'unknown'),
+        'gpu_driver': device.get('driver', 'unknown'),
+        'vram_gb': device.get('vram_gb', 0),
+        'run_date': run_date,
+        'total_tests': len(results),
+        'notes': '',
+    }
+
+    return pd.DataFrame([row])
+
+
+# json_normalize column paths -> Summary sheet columns
+_SUMMARY_COLUMNS = {
+    'test_id': 'test_id',
+    'configuration.pipeline': 'pipeline',
+    'configuration.resolution': 'resolution',
+    'configuration.scene_type': 'scene',
+    'configuration.shader': 'shader',
+    'configuration.screen_width': 'screen_width',
+    'configuration.screen_height': 'screen_height',
+    'statistics.fps_mean': 'fps_mean',
+    'statistics.frame_time_mean': 'frame_time_mean_ms',
+    'statistics.frame_time_p99': 'frame_time_p99_ms',
+    'statistics.frame_time_stddev': 'frame_time_stddev',
+    'statistics.bandwidth_mean': 'bandwidth_mean_gbps',
+}
+
+_SUMMARY_DEFAULTS = {
+    'test_id': 'unknown',
+    'pipeline': 'unknown',
+    'resolution': 0,
+    'scene': 'unknown',
+    'shader': 'unknown',
+    'screen_width': 0,
+    'screen_height': 0,
+    'fps_mean': 0,
+    'frame_time_mean_ms': 0,
+    'frame_time_p99_ms': 0,
+    'frame_time_stddev': 0,
+    'bandwidth_mean_gbps': 0,
+}
+
+
+# Explicit numeric dtypes: skips pandas' full-column inference scan and
+# float32 halves the bytes pushed through the Excel writer
+_SUMMARY_DTYPES = {
+    'resolution': 'int32',
+    'screen_width': 'int32',
+    'screen_height': 'int32',
+    'fps_mean': 'float32',
+    'frame_time_mean_ms': 'float32',
+    'frame_time_p99_ms': 'float32',
+    'frame_time_stddev': 'float32',
+    'bandwidth_mean_gbps': 'float32',
+}
+
+
+def extract_summary_data(results: list[dict], benchmark_id: str) -> pd.DataFrame:
+    """Extract summary statistics with benchmark_id reference."""
+    import pandas as pd
+
+    if not results:
+        return pd.DataFrame()
+
+    # Flatten configuration/statistics in one pass instead of building
+    # per-row dicts in a Python loop
+    df = pd.json_normalize(results, max_level=1)
+
+    # Guarantee every expected column exists even if some results omit keys
+    for source in _SUMMARY_COLUMNS:
+        if source not in df.columns:
+            df[source] = None
+
+    df = df[list(_SUMMARY_COLUMNS)].rename(columns=_SUMMARY_COLUMNS)
+    df = df.fillna(_SUMMARY_DEFAULTS)
+
+    # Skip unknown pipelines/scenes
+    df = df[(df['pipeline'] != 'unknown') & (df['scene'] != 'unknown')]
+    if df.empty:
+        return pd.DataFrame()
+
+    df = df.astype(_SUMMARY_DTYPES)
+
+    # Ordered categorical: sort_values and downstream groupbys then work on
+    # integer codes instead of hashing strings. Unexpected pipeline names
+    # are kept as trailing categories rather than silently becoming NaN.
+    categories = list(PIPELINE_SHEET_NAMES)
+    categories += [p for p in df['pipeline'].unique() if p not in PIPELINE_SHEET_NAMES]
+    df['pipeline'] = pd.Categorical(df['pipeline'], categories=categories, ordered=True)
+
+    df.insert(0, 'benchmark_id', benchmark_id)
+    return df.sort_values(['pipeline', 'resolution', 'scene'])
+
+
+def extract_frame_data_by_pipeline(results: list[dict], benchmark_id: str) -> dict[str, pd.DataFrame]:
+    """Extract per-frame data separated by pipeline type.
+
+    Note: Frame at midpoint (warmup + measurement/2) is filtered out because
+    FrameCapture takes a debug screenshot there, causing artificial spikes.
+    """
+    import pandas as pd
+
+    # Pre-size the output columns per pipeline so each is filled in place
+    # by one sequential pass - no per-test temporaries, no final concat
+    caps = {name: 0 for name in PIPELINE_SHEET_NAMES.values()}
+    for result in results:
+        pipeline = result.get('configuration', {}).get('pipeline', 'unknown')
+        frames = result.get('frames')
+        if pipeline in PIPELINE_SHEET_NAMES and frames:
+            caps[PIPELINE_SHEET_NAMES[pipeline]] += len(frames['frame_num'])
+
+    buckets = {
+        name: {
+            'benchmark_id': [],
+            'test_id': [],
+            'arrays': {f: np.empty(caps[name], dtype) for f, dtype in FRAME_FIELDS},
+            'count': 0,
+        }
+        for name in PIPELINE_SHEET_NAMES.values()
+    }
+
+    for result in results:
+        config = result.get('configuration', {})
+        pipeline = config.get('pipeline', 'unknown')
+        test_id = result.get('test_id', 'unknown')
+        frames = result.get('frames')
+
+        # Skip unknown pipeline
+        if pipeline == 'unknown' or pipeline not in PIPELINE_SHEET_NAMES:
+            continue
+        if not frames:
+            continue
+
+        # Calculate capture frame to filter (midpoint of measurement frames)
+        # Default: 50 warmup + 50 (half of 100 measurement) = frame 100 in raw numbering
+        # But frame_num in JSON is 0-indexed from measurement start, so midpoint = 50
+        measurement_frames = len(frames['frame_num'])
+        capture_frame = measurement_frames // 2  # Midpoint where debug capture occurs
+
+        # Drop the capture frame (causes artificial spike due to GPU readback)
+        keep = frames['frame_num'] != capture_frame
+        kept = int(np.count_nonzero(keep))
+
+        bucket = buckets[PIPELINE_SHEET_NAMES[pipeline]]
+        offset = bucket['count']
+        bucket['benchmark_id'].extend([benchmark_id] * kept)
+        bucket['test_id'].extend([test_id] * kept)
+        for field, _ in FRAME_FIELDS:
+            arr = frames[field]
+            bucket['arrays'][field][offset:offset + kept] = arr if kept == measurement_frames else arr[keep]
+        bucket['count'] = offset + kept
+
+    frame_dfs = {}
+    for sheet_name, bucket in buckets.items():
+        count = bucket['count']
+        if count == 0:
+            frame_dfs[sheet_name] = pd.DataFrame()
+            continue
+        columns = {
+            'benchmark_id': bucket['benchmark_id'],
+            'test_id': bucket['test_id'],
+            'frame': bucket['arrays']['frame_num'][:count],
+        }
+        for field, _ in FRAME_FIELDS[1:]:
+            columns[field] = bucket['arrays'][field][:count]
+        frame_dfs[sheet_name] = pd.DataFrame(columns, copy=False)
+
+    return frame_dfs
+
+
+def extract_cross_machine_data(summary_dfs: list[pd.DataFrame],
+                               benchmark_dfs: list[pd.DataFrame]) -> pd.DataFrame:
+    """Generate cross-machine comparison from accumulated Summary data.
+
+    Takes the DataFrames already produced while merging benchmarks rather
+    than reparsing them back out of the sheet rows on every save.
+    """
+    import pandas as pd
+
+    if not summary_dfs or not benchmark_dfs:
+        return pd.DataFrame()
+
+    summary_df = pd.concat(summary_dfs, ignore_index=True)
+    if summary_df.empty or 'benchmark_id' not in summary_df.columns:
+        return pd.DataFrame()
+
+    # Benchmarks data provides machine/GPU info
+    bench_df = pd.concat(benchmark_dfs, ignore_index=True)
+    if bench_df.empty:
+        return pd.DataFrame()
+
+    # Merge to get GPU info
+    merged = summary_df.merge(bench_df[['benchmark_id', 'machine_name', 'gpu_name']], on='benchmark_id', how='left')
+
+    # Group by GPU and pipeline for comparison
+    if 'fps_mean' in merged.columns and 'pipeline' in merged.columns:
+        # sort=False skips the redundant hash sort (Summary is already
+        # ordered); observed=True keeps unused categorical combos out
+        comparison = merged.groupby(['gpu_name', 'pipeline'], sort=False, observed=True).agg({
+            'fps_mean': ['mean', 'min', 'max'],
+            'frame_time_mean_ms': 'mean',
+            'test_id': 'count',
+        }).round(2)
+
+        comparison.columns = ['avg_fps', 'min_fps', 'max_fps', 'avg_frame_time_ms', 'test_count']
+        return comparison.reset_index()
+
+    return pd.DataFrame()
+
+
+# Header styling for xlsxwriter's add_format (same look the openpyxl
+# writer produced: blue fill, white bold text, centered, thin border)
+_HEADER_FORMAT = {
+    'bold': True,
+    'bg_color': '#4472C4',
+    'font_color': '#FFFFFF',
+    'align': 'center',
+    'border': 1,
+}
+
+
+# Known numeric columns have bounded widths - no need to measure them
+_FIXED_WIDTHS = {
+    'frame': 8,
+    'frame_time_ms': 14,
+    'fps': 10,
+    'fps_mean': 10,
+    'frame_time_mean_ms': 18,
+    'frame_time_p99_ms': 17,
+    'frame_time_stddev': 17,
+    'bandwidth_mean_gbps': 19,
+    'bandwidth_read_gbps': 19,
+    'bandwidth_write_gbps': 20,
+    'vram_mb': 10,
+    'avg_voxels_per_ray': 18,
+    'ray_throughput_mrays': 20,
+    'resolution': 11,
+    'screen_width': 13,
+    'screen_height': 14,
+    'vram_gb': 9,
+    'total_tests': 12,
+}
+
+# Rows sampled per column when a width has to be measured
+_WIDTH_SAMPLE_ROWS = 200
+
+
+def _column_widths(headers: list, rows: list) -> list[int]:
+    """Column widths from in-memory rows.
+
+    Known numeric columns get fixed widths; the rest are measured from the
+    first _WIDTH_SAMPLE_ROWS rows only - value widths barely vary, and a
+    full scan of a 50k-row frame sheet is all str() conversion cost.
+    """
+    sample = rows[:_WIDTH_SAMPLE_ROWS]
+    widths = []
+    for idx, header in enumerate(headers):
+        fixed = _FIXED_WIDTHS.get(header)
+        if fixed is not None:
+            widths.append(fixed)
+            continue
+        max_length = len(str(header or ""))
+        for row in sample:
+            value = row[idx] if idx < len(row) else None
+            length = len(str(value or ""))
+            if length > max_length:
+                max_length = length
+        widths.append(min(max_length + 2, 50))
+    return widths
+
+
+def _read_existing_sheets(path: Path) -> dict[str, tuple[list, list]]:
+    """Read an existing workbook into {sheet_name: (headers, rows)}.
+
+    read_only mode streams the XML instead of building Cell objects;
+    iter_rows(values_only=True) hands back plain value tuples directly.
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    sheets = {}
+    for name in wb.sheetnames:
+        rows = wb[name].iter_rows(values_only=True)
+        headers = next(rows, None)
+        if headers is not None:
+            sheets[name] = (list(headers), list(rows))
+    wb.close()
+    return sheets
+
+
+def _load_sheets(output_path: Path) -> tuple[dict[str, tuple[list, list]], dict[str, list]]:
+    """Load existing workbook rows for merging, or start empty.
+
+    Also returns the Cross_Machine accumulator: lists of Summary and
+    Benchmarks DataFrames, seeded from any pre-existing sheet rows so the
+    comparison covers old runs too. _append_benchmark adds to these lists;
+    the final groupby happens once in _write_workbook.
+    """
+    import pandas as pd
+
+    cross = {'Summary': [], 'Benchmarks': []}
+    if output_path.exists():
+        print(f"Appending to existing workbook: {output_path}")
+        sheets = _read_existing_sheets(output_path)
+        # Regenerated on write from the merged Summary/Benchmarks data
+        sheets.pop('Cross_Machine', None)
+        for name in cross:
+            if name in sheets:
+                headers, rows = sheets[name]
+                if rows:
+                    cross[name].append(pd.DataFrame(rows, columns=headers))
+        return sheets, cross
+    print(f"Creating new workbook: {output_path}")
+    return {}, cross
+
+
+def _append_benchmark(sheets: dict[str, tuple[list, list]], cross: dict[str, list],
+                      results: list[dict], benchmark_id: str, machine_name: str):
+    """Extract one benchmark's data and merge it into the sheet rows."""
+    benchmark_df = extract_benchmark_metadata(results, benchmark_id, machine_name)
+    summary_df = extract_summary_data(results, benchmark_id)
+    frame_dfs = extract_frame_data_by_pipeline(results, benchmark_id)
+
+    if not summary_df.empty:
+        cross['Summary'].append(summary_df)
+    if not benchmark_df.empty:
+        cross['Benchmarks'].append(benchmark_df)
+
+    def merge(name: str, df: pd.DataFrame):
+        if name in sheets:
+            headers, rows = sheets[name]
+        elif not df.empty:
+            headers, rows = list(df.columns), []
+        else:
+            return
+        if not df.empty:
+            rows.extend(df.itertuples(index=False, name=None))
+        sheets[name] = (headers, rows)
+
+    merge('Benchmarks', benchmark_df)
+    merge('Summary', summary_df)
+    for sheet_name, frame_df in frame_dfs.items():
+        merge(sheet_name, frame_df)
+
+
+def _write_workbook(sheets: dict[str, tuple[list, list]], cross: dict[str, list],
+                    output_path: Path):
+    """Stream the merged sheets out as a fresh workbook via xlsxwriter.
+
+    constant_memory mode flushes each row to disk as it is written (O(1)
+    memory), and xlsxwriter's bulk row path is measurably faster than
+    openpyxl's. Reading existing workbooks stays on openpyxl - xlsxwriter
+    is write-only by design, which fits this always-rewrite flow.
+    """
+    import xlsxwriter
+
+    # Cross_Machine (regenerated each write from the accumulated DataFrames)
+    cross_df = extract_cross_machine_data(cross['Summary'], cross['Benchmarks'])
+    if not cross_df.empty:
+        sheets['Cross_Machine'] = (
+            list(cross_df.columns),
+            list(cross_df.itertuples(index=False, name=None)),
+        )
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    wb = xlsxwriter.Workbook(str(output_path), {
+        'constant_memory': True,
+        'strings_to_numbers': False,
+        # Stray NaN/inf become Excel errors instead of raising mid-write
+        'nan_inf_to_errors': True,
+    })
+    header_format = wb.add_format(_HEADER_FORMAT)
+
+    for name, (headers, rows) in sheets.items():
+        ws = wb.add_worksheet(name)
+        for idx, width in enumerate(_column_widths(headers, rows)):
+            ws.set_column(idx, idx, width)
+        ws.write_row(0, 0, headers, header_format)
+        for row_idx, row in enumerate(rows, 1):
+            ws.write_row(row_idx, 0, row)
+
+    wb.close()
+    print(f"Excel workbook saved: {output_path}")
+
+
+def _sheets_to_frames(sheets: dict[str, tuple[list, list]]) -> dict[str, pd.DataFrame]:
+    """Convert merged sheet rows to DataFrames (generate_charts' input shape)."""
+    import pandas as pd
+
+    return {
+        name: pd.DataFrame(rows, columns=headers)
+        for name, (headers, rows) in sheets.items()
+    }
+
+
+def create_or_update_workbook(results: list[dict], output_path: Path, benchmark_id: str, machine_name: str):
+    """Create new or append to existing Excel workbook."""
+    sheets, cross = _load_sheets(output_path)
+    _append_benchmark(sheets, cross, results, benchmark_id, machine_name)
+    _write_workbook(sheets, cross, output_path)
+
+
+def aggregate(results_dir: Path, output_path: Path,
+              machine_name: str | None = None) -> dict[str, pd.DataFrame] | None:
+    """Aggregate one results directory; return the sheet DataFrames.
+
+    The workbook is still written - it stays the shareable artifact - but
+    the returned frames let refresh_visualizations feed chart generation
+    directly instead of parsing the xlsx straight back in.
+    """
+    results = load_benchmark_results(results_dir)
+    if not results:
+        return None
+
+    benchmark_id = generate_benchmark_id()
+    machine = machine_name or get_machine_name()
+    print(f"Benchmark ID: {benchmark_id}")
+    print(f"Machine: {machine}")
+
+    sheets, cross = _load_sheets(output_path)
+    _append_benchmark(sheets, cross, results, benchmark_id, machine)
+    _write_workbook(sheets, cross, output_path)
+    print(f"Aggregated {len(results)} benchmark results")
+
+    # _write_workbook merged Cross_Machine into sheets, so this covers it
+    return _sheets_to_frames(sheets)
+
+
+def cleanup_transient_files(results_dir: Path):
+    """Delete JSON files and debug_images after successful aggregation."""
+    # Delete JSON files
+    json_files = list(results_dir.glob("*.json"))
+    for json_file in json_files:
+        try:
+            json_file.unlink()
+            print(f"Deleted: {json_file.name}")
+        except IOError as e:
+            print(f"Warning: Could not delete {json_file}: {e}")
+
+    # Delete debug_images directory
+    debug_images_dir = results_dir / "debug_images"
+    if debug_images_dir.exists():
+        try:
+            shutil.rmtree(debug_images_dir)
+            print(f"Deleted: debug_images/")
+        except IOError as e:
+            print(f"Warning: Could not delete debug_images: {e}")
+
+
+def pack_benchmark(source_dir: Path, output_zip: Path | None = None) -> Path:
+    """
+    Pack a benchmark folder into a ZIP archive for transport.
+
+    Args:
+        source_dir: Path to benchmark folder containing JSON files
+        output_zip: Optional output path (default: same name with .zip extension)
+
+    Returns:
+        Path to created ZIP file
+    """
+    if not source_dir.exists():
+        raise FileNotFoundError(f"Source directory not found: {source_dir}")
+
+    if output_zip is None:
+        output_zip = source_dir.with_suffix('.zip')
+
+    print(f"Packing {source_dir} -> {output_zip}")
+
+    # compresslevel=1 (fast deflate) packs the JSON several times faster
+    # than the default level 6 with only a modest ratio loss
+    original_size = 0
+    with zipfile.ZipFile(output_zip, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        for file_path in source_dir.rglob('*'):
+            if file_path.is_file():
+                original_size += file_path.stat().st_size
+                arcname = file_path.relative_to(source_dir.parent)
+                if file_path.suffix.lower() in STORED_SUFFIXES:
+                    # Don't burn CPU re-deflating debug images
+                    zf.write(file_path, arcname, compress_type=zipfile.ZIP_STORED)
+                else:
+                    zf.write(file_path, arcname)
+                print(f"  Added: {arcname}")
+
+    compressed_size = output_zip.stat().st_size
+    ratio = original_size / compressed_size if compressed_size > 0 else 0
+
+    print(f"Packed: {original_size / 1024:.1f} KB -> {compressed_size / 1024:.1f} KB ({ratio:.1f}x compression)")
+    return output_zip
+
+
+def unpack_benchmark(zip_path: Path, output_dir: Path | None = None) -> Path:
+    """
+    Unpack a benchmark ZIP archive.
+
+    Args:
+        zip_path: Path to ZIP file
+        output_dir: Optional output directory (default: same location as ZIP)
+
+    Returns:
+        Path to extracted directory
+    """
+    if not zip_path.exists():
+        raise FileNotFoundError(f"ZIP file not found: {zip_path}")
+
+    if output_dir is None:
+        output_dir = zip_path.parent
+
+    print(f"Unpacking {zip_path} -> {output_dir}")
+
+    with zipfile.ZipFile(zip_path, 'r') as zf:
+        zf.extractall(output_dir)
+        # Archives produced by pack_benchmark have a single top-level
+        # folder, so the first entry is enough to name it - no need to
+        # walk the whole namelist
+        infos = zf.infolist()
+        if infos:
+            extracted_dir = output_dir / Path(infos[0].filename).parts[0]
+        else:
+            extracted_dir = output_dir
+
+    print(f"Extracted to: {extracted_dir}")
+    return extracted_dir
+
+
+def get_benchmark_folders() -> list[Path]:
+    """Get all benchmark folders in data/benchmarks/."""
+    BENCHMARKS_DIR.mkdir(parents=True, exist_ok=True)
+
+    folders = []
+    for item in BENCHMARKS_DIR.iterdir():
+        if item.is_dir() and list(item.glob("*.json")):
+            folders.append(item)
+
+    return sorted(folders)
+
+
+def process_all_benchmarks(output_path: Path, cleanup: bool = False) -> int:
+    """
+    Process all benchmark folders in data/benchmarks/.
+
+    Args:
+        output_path: Path to output Excel file
+        cleanup: Whether to delete JSON files after aggregation
+
+    Returns:
+        Number of benchmarks processed
+    """
+    folders = get_benchmark_folders()
+
+    if not folders:
+        print(f"No benchmark folders found in {BENCHMARKS_DIR}")
+        print("Expected structure: data/benchmarks/benchmark_001/*.json")
+        return 0
+
+    print(f"Found {len(folders)} benchmark folder(s):")
+    for folder in folders:
+        json_count = len(list(folder.glob("*.json")))
+        print(f"  - {folder.name}: {json_count} JSON files")
+
+    machine_name = get_machine_name()
+
+    # Read the existing workbook once, merge every folder in memory, and
+    # save once at the end - a per-folder load/save cycle makes the total
+    # XML work quadratic in the number of benchmarks
+    sheets, cross = _load_sheets(output_path)
+
+    aggregated = []
+    for folder in folders:
+        print(f"\n{'='*60}")
+        print(f"Processing: {folder.name}")
+        print('='*60)
+
+        results = load_benchmark_results(folder)
+        if not results:
+            print(f"No valid results in {folder.name}, skipping")
+            continue
+
+        # Use folder name as part of benchmark ID for traceability
+        benchmark_id = f"{folder.name[:8]}_{generate_benchmark_id()}"
+
+        print(f"Benchmark ID: {benchmark_id}")
+        print(f"Machine: {machine_name}")
+
+        _append_benchmark(sheets, cross, results, benchmark_id, machine_name)
+        print(f"Aggregated {len(results)} results from {folder.name}")
+
+        aggregated.append(folder)
+
+    if aggregated:
+        _write_workbook(sheets, cross, output_path)
+
+        # Only delete sources once the workbook is safely on disk - the
+        # JSONs are the sole copy of the data until then (a failed write,
+        # e.g. the xlsx open in Excel, must not cost the benchmarks)
+        if cleanup:
+            for folder in aggregated:
+                print(f"\nCleaning up {folder.name}...")
+                cleanup_transient_files(folder)
+
+    return len(aggregated)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Aggregate benchmark results to Excel",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Process single benchmark_results/ directory
+  python aggregate_results.py
+
+  # Process all benchmark folders in data/benchmarks/
+  python aggregate_results.py --process-all
+
+  # Pack a benchmark folder for sharing
+  python aggregate_results.py --pack benchmark_results/
+
+  # Unpack received benchmark archive
+  python aggregate_results.py --unpack benchmark_001.zip
+
+  # Process with cleanup
+  python aggregate_results.py --process-all --cleanup
+        """
+    )
+    parser.add_argument('--output', '-o', type=Path, default=EXCEL_FILE,
+                        help=f"Output Excel file (default: {EXCEL_FILE})")
+    parser.add_argument('--input', '-i', type=Path, default=BENCHMARK_RESULTS_DIR,
+                        help=f"Input directory with JSON results (default: {BENCHMARK_RESULTS_DIR})")
+    parser.add_argument('--cleanup', action='store_true',
+                        help="Delete JSON files and debug_images after aggregation")
+    parser.add_argument('--machine-name', type=str, default=None,
+                        help="Override machine name (default: from env/config/hostname)")
+
+    # New multi-tester options
+    parser.add_argument('--process-all', action='store_true',
+                        help=f"Process all benchmark folders in {BENCHMARKS_DIR}")
+    parser.add_argument('--pack', type=Path, metavar='DIR',
+                        help="Pack a benchmark folder into ZIP for transport")
+    parser.add_argument('--unpack', type=Path, metavar='ZIP',
+                        help="Unpack a benchmark ZIP archive")
+    parser.add_argument('--list', '-l', action='store_true',
+                        help="List available benchmark folders")
+
+    return run(parser.parse_args())
+
+
+def run(args: argparse.Namespace) -> int:
+    """Execute the CLI with a parsed namespace.
+
+    Split from main() so in-process callers (refresh_visualizations or
+    other tooling) can invoke any mode without a subprocess.
+    """
+    # Handle --pack command
+    if args.pack:
+        try:
+            zip_path = pack_benchmark(args.pack)
+            print(f"\nReady for transport: {zip_path}")
+            return 0
+        except FileNotFoundError as e:
+            print(f"Error: {e}")
+            return 1
+
+    # Handle --unpack command
+    if args.unpack:
+        try:
+            extracted = unpack_benchmark(args.unpack, BENCHMARKS_DIR)
+            print(f"\nReady for processing: {extracted}")
+            print(f"Run: python aggregate_results.py --process-all")
+            return 0
+        except FileNotFoundError as e:
+            print(f"Error: {e}")
+            return 1
+
+    # Handle --list command
+    if args.list:
+        folders = get_benchmark_folders()
+        if not folders:
+            print(f"No benchmark folders found in {BENCHMARKS_DIR}")
+        else:
+            print(f"Benchmark folders in {BENCHMARKS_DIR}:")
+            for folder in folders:
+                json_count = len(list(folder.glob("*.json")))
+                print(f"  - {folder.name}: {json_count} JSON files")
+        return 0
+
+    # Handle --process-all command
+    if args.process_all:
+        processed = process_all_benchmarks(args.output, args.cleanup)
+        print(f"\nProcessed {processed} benchmark folder(s)")
+        return 0 if processed > 0 else 1
+
+    # Default: process single input directory
+    if not args.input.exists():
+        print(f"Error: Input directory not found: {args.input}")
+        return 1
+
+    if aggregate(args.input, args.output, args.machine_name) is None:
+        print("No benchmark results found to aggregate.")
+        return 1
+
+    if args.cleanup:
+        print("\nCleaning up transient files...")
+        cleanup_transient_files(args.input)
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,631 @@
+#!/usr/bin/env python3
+"""
+Generate charts from Excel benchmark data.
+
+Reads data from data/benchmarks.xlsx (normalized schema) and generates charts
+(SVG, plus PNG for the raster heatmap) to Vixen-Docs/Assets/charts/ for
+embedding in Obsidian.
+
+Schema expects:
+- Benchmarks: Machine/GPU metadata with benchmark_id
+- Summary: Test statistics with benchmark_id reference
+- HW_RT_Frames, Compute_Frames, Fragment_Frames: Per-frame data by pipeline
+- Cross_Machine: Multi-GPU comparison data
+
+Usage:
+    python generate_charts.py [--input PATH] [--charts CHART_NAMES...]
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pandas as pd
+import matplotlib
+matplotlib.use('Agg', force=True)  # headless; skip GUI backend probing
+import matplotlib.pyplot as plt
+import numpy as np
+
+from chart_config import (
+    apply_style, save_chart, get_pipeline_color,
+    EXCEL_FILE, CHARTS_OUTPUT_DIR, COLORS
+)
+
+# Parquet sheet cache needs pyarrow; without it every run parses the xlsx
+try:
+    import pyarrow  # noqa: F401
+    _HAVE_PARQUET = True
+except ImportError:
+    _HAVE_PARQUET = False
+
+# python-calamine parses xlsx in native code, several times faster than
+# openpyxl's pure-Python XML path; same DataFrame contract either way
+try:
+    import python_calamine  # noqa: F401
+    _EXCEL_ENGINE = 'calamine'
+except ImportError:
+    _EXCEL_ENGINE = 'openpyxl'
+
+
+def _cache_dir(excel_path: Path) -> Path:
+    """Cache directory keyed by workbook content hash.
+
+    A changed workbook gets a new hash, so stale cache entries can never
+    be served; old hash directories are pruned when the cache refreshes.
+    """
+    digest = hashlib.blake2b(excel_path.read_bytes()).hexdigest()[:16]
+    return excel_path.parent / '.cache' / digest
+
+
+def _read_cache(cache_dir: Path) -> dict[str, pd.DataFrame]:
+    sheets = {}
+    for parquet_file in sorted(cache_dir.glob('*.parquet')):
+        # No-op for caches written after the cast; fixes up older ones
+        sheets[parquet_file.stem] = _categorize(pd.read_parquet(parquet_file, engine='pyarrow'))
+        print(f"Loaded sheet from cache: {parquet_file.stem} ({len(sheets[parquet_file.stem])} rows)")
+    return sheets
+
+
+def _write_cache(cache_dir: Path, sheets: dict[str, pd.DataFrame]):
+    # Drop caches for previous workbook revisions before writing this one
+    root = cache_dir.parent
+    if root.exists():
+        for stale in root.iterdir():
+            if stale.is_dir() and stale != cache_dir:
+                shutil.rmtree(stale, ignore_errors=True)
+    root.mkdir(parents=True, exist_ok=True)
+
+    # Stage into a temp directory and rename into place: an interrupted
+    # write must not leave a partial cache_dir, since any directory under
+    # the current workbook hash is served as complete on the next run
+    staging = Path(tempfile.mkdtemp(dir=root, prefix='.staging-'))
+    try:
+        for name, df in sheets.items():
+            df.to_parquet(staging / f"{name}.parquet", engine='pyarrow', compression='zstd')
+        shutil.rmtree(cache_dir, ignore_errors=True)  # e.g. left empty by a prior run
+        os.replace(staging, cache_dir)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+
+# Columns the charts group/pivot on. Cast to category once at load so
+# every aggregation works on integer codes instead of re-hashing strings.
+_CATEGORY_COLUMNS = ('pipeline', 'scene', 'gpu_name', 'machine_name', 'resolution')
+
+# Measure columns the charts scan; float32 is plenty for display values
+# rounded to one or two decimals, and halves the bytes every groupby moves
+_DOWNCAST_COLUMNS = ('fps_mean', 'frame_time_mean_ms', 'frame_time_p99_ms',
+                     'bandwidth_mean_gbps', 'avg_fps', 'avg_frame_time_ms')
+
+
+def _categorize(df: pd.DataFrame) -> pd.DataFrame:
+    for col in _CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    for col in _DOWNCAST_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast='float')
+    return df
+
+
+def load_excel_data(excel_path: Path) -> dict[str, pd.DataFrame]:
+    """Load all sheets from Excel workbook.
+
+    Sheets are independent XML parts, and openpyxl's parser releases the
+    GIL while libexpat chews through them - so on the openpyxl engine they
+    are parsed in a thread pool, overlapping the per-sheet work that
+    dominates the cold load. The calamine engine is not thread-safe and
+    reads sequentially instead.
+
+    When pyarrow is available the parsed sheets are mirrored to a Parquet
+    cache keyed by the workbook's content hash; chart-only reruns then
+    skip the xlsx parse entirely.
+    """
+    sheets = {}
+
+    try:
+        cache_dir = _cache_dir(excel_path) if _HAVE_PARQUET else None
+        if cache_dir is not None and cache_dir.is_dir():
+            sheets = _read_cache(cache_dir)
+            if sheets:
+                return sheets
+
+        xl = pd.ExcelFile(excel_path, engine=_EXCEL_ENGINE)
+        sheet_names = xl.sheet_names
+        if _EXCEL_ENGINE == 'calamine':
+            # calamine's workbook is a PyO3 object - borrowing it from
+            # multiple threads raises "Already mutably borrowed", so read
+            # sequentially; its native parse still beats threaded openpyxl
+            for sheet_name in sheet_names:
+                sheets[sheet_name] = _categorize(pd.read_excel(xl, sheet_name=sheet_name))
+                print(f"Loaded sheet: {sheet_name} ({len(sheets[sheet_name])} rows)")
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(sheet_names))) as executor:
+                futures = {
+                    name: executor.submit(pd.read_excel, xl, sheet_name=name)
+                    for name in sheet_names
+                }
+                for sheet_name, future in futures.items():
+                    sheets[sheet_name] = _categorize(future.result())
+                    print(f"Loaded sheet: {sheet_name} ({len(sheets[sheet_name])} rows)")
+
+        if cache_dir is not None and sheets:
+            _write_cache(cache_dir, sheets)
+    except FileNotFoundError:
+        print(f"Error: Excel file not found: {excel_path}")
+        print("Run aggregate_results.py first to create the Excel file.")
+
+    return sheets
+
+
+def get_summary_with_gpu(data: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """Join Summary with Benchmarks to get GPU info."""
+    if 'Summary' not in data or 'Benchmarks' not in data:
+        return pd.DataFrame()
+
+    summary = data['Summary'].copy()
+    benchmarks = data['Benchmarks'][['benchmark_id', 'gpu_name', 'machine_name']].copy()
+
+    if summary.empty or benchmarks.empty:
+        return summary
+
+    return summary.merge(benchmarks, on='benchmark_id', how='left')
+
+
+@dataclass
+class Aggregates:
+    """Aggregations shared by the chart functions, computed once per run.
+
+    Every chart used to re-groupby/pivot the same Summary sheet; with the
+    results precomputed here each chart is just plotting.
+    """
+    summary: pd.DataFrame = field(default_factory=pd.DataFrame)
+    cross_machine: pd.DataFrame = field(default_factory=pd.DataFrame)
+    fps_by_pipe: pd.Series = field(default_factory=lambda: pd.Series(dtype='float64'))
+    ft_by_pipe: pd.Series = field(default_factory=lambda: pd.Series(dtype='float64'))
+    bw_by_pipe: pd.Series = field(default_factory=lambda: pd.Series(dtype='float64'))
+    fps_res_pipe: pd.DataFrame = field(default_factory=pd.DataFrame)    # resolution x pipeline
+    fps_scene_pipe: pd.DataFrame = field(default_factory=pd.DataFrame)  # scene x pipeline
+    fps_scene_res: pd.DataFrame = field(default_factory=pd.DataFrame)   # scene x resolution
+    fps_res_gpu: pd.DataFrame = field(default_factory=pd.DataFrame)     # resolution x gpu_name
+
+
+def _build_aggregates(data: dict[str, pd.DataFrame]) -> Aggregates:
+    """Compute all shared aggregations over the loaded sheets."""
+    agg = Aggregates(
+        summary=data.get('Summary', pd.DataFrame()),
+        cross_machine=data.get('Cross_Machine', pd.DataFrame()),
+    )
+
+    df = agg.summary
+    if not df.empty and 'fps_mean' in df.columns:
+        # One grouped scan computes all three per-pipeline means - the
+        # group-id hashing dominates groupby cost and is now shared
+        named = {'fps': ('fps_mean', 'mean')}
+        if 'frame_time_mean_ms' in df.columns:
+            named['ft'] = ('frame_time_mean_ms', 'mean')
+        if 'bandwidth_mean_gbps' in df.columns:
+            named['bw'] = ('bandwidth_mean_gbps', 'mean')
+        means = df.groupby('pipeline', observed=True).agg(**named)
+
+        agg.fps_by_pipe = means['fps'].round(2)
+        if 'ft' in means.columns:
+            agg.ft_by_pipe = means['ft'].round(2)
+        if 'bw' in means.columns:
+            agg.bw_by_pipe = means['bw']
+        has_res = 'resolution' in df.columns
+        has_scene = 'scene' in df.columns
+        if has_res and has_scene:
+            # One 3-key grouped pass feeds all three pivots; reducing the
+            # per-cell means is exact because the benchmark grid is
+            # balanced (each pipeline/resolution/scene cell has the same
+            # number of test rows per run)
+            cell = df.groupby(['pipeline', 'resolution', 'scene'],
+                              observed=True)['fps_mean'].mean()
+            agg.fps_res_pipe = cell.groupby(
+                level=['resolution', 'pipeline'], observed=True).mean().unstack('pipeline')
+            agg.fps_scene_pipe = cell.groupby(
+                level=['scene', 'pipeline'], observed=True).mean().unstack('pipeline')
+            agg.fps_scene_res = cell.groupby(
+                level=['scene', 'resolution'], observed=True).mean().unstack('resolution')
+        elif has_res:
+            agg.fps_res_pipe = df.groupby(
+                ['resolution', 'pipeline'], observed=True)['fps_mean'].mean().unstack('pipeline')
+        elif has_scene:
+            agg.fps_scene_pipe = df.groupby(
+                ['scene', 'pipeline'], observed=True)['fps_mean'].mean().unstack('pipeline')
+
+    summary_with_gpu = get_summary_with_gpu(data)
+    if not summary_with_gpu.empty and 'gpu_name' in summary_with_gpu.columns:
+        agg.fps_res_gpu = summary_with_gpu.groupby(
+            ['resolution', 'gpu_name'], observed=True)['fps_mean'].mean().unstack('gpu_name')
+
+    return agg
+
+
+# One Figure per process, reused by every chart rendered there. Figure
+# and backend-canvas construction cost ~100-200ms each - a real slice of
+# a small chart's wall time - and reuse amortizes it away.
+_FIG = None
+
+
+def _shared_axes(figsize: tuple[float, float]):
+    """Return the process-wide figure resized for this chart, axes cleared."""
+    global _FIG
+    import matplotlib.pyplot as plt
+
+    if _FIG is None:
+        _FIG = plt.figure(figsize=figsize)
+        _FIG.add_subplot(111)
+    # Drop any extra axes a previous chart added (e.g. a colorbar)
+    for extra in _FIG.axes[1:]:
+        extra.remove()
+    ax = _FIG.axes[0]
+    ax.clear()
+    _FIG.set_size_inches(*figsize)
+    return _FIG, ax
+
+
+def chart_fps_by_pipeline(agg: Aggregates) -> Path | None:
+    """Create bar chart comparing FPS across pipelines."""
+    comparison = agg.fps_by_pipe
+    if comparison.empty:
+        print("Skipping fps_by_pipeline: No Summary data")
+        return None
+
+    fig, ax = _shared_axes((10, 6))
+
+    pipelines = comparison.index.tolist()
+    fps_values = comparison.tolist()
+    colors = [get_pipeline_color(p) for p in pipelines]
+
+    bars = ax.bar(pipelines, fps_values, color=colors, edgecolor='black', linewidth=0.5)
+
+    ax.bar_label(bars, labels=[f'{v:.1f}' for v in fps_values], padding=3, fontsize=10)
+
+    ax.set_xlabel('Pipeline')
+    ax.set_ylabel('Average FPS')
+    ax.set_title('Performance Comparison: Average FPS by Pipeline')
+    ax.set_ylim(0, max(fps_values) * 1.15)
+
+    return save_chart(fig, 'fps_by_pipeline', close=False, fmt='svg')
+
+
+def chart_frame_time_by_pipeline(agg: Aggregates) -> Path | None:
+    """Create bar chart comparing frame times across pipelines."""
+    comparison = agg.ft_by_pipe
+    if comparison.empty:
+        print("Skipping frame_time_by_pipeline: No Summary data")
+        return None
+
+    fig, ax = _shared_axes((10, 6))
+
+    pipelines = comparison.index.tolist()
+    frame_times = comparison.tolist()
+    colors = [get_pipeline_color(p) for p in pipelines]
+
+    bars = ax.bar(pipelines, frame_times, color=colors, edgecolor='black', linewidth=0.5)
+
+    ax.bar_label(bars, labels=[f'{v:.2f}ms' for v in frame_times], padding=3, fontsize=10)
+
+    ax.set_xlabel('Pipeline')
+    ax.set_ylabel('Average Frame Time (ms)')
+    ax.set_title('Performance Comparison: Average Frame Time by Pipeline')
+    ax.set_ylim(0, max(frame_times) * 1.2)
+
+    return save_chart(fig, 'frame_time_by_pipeline', close=False, fmt='svg')
+
+
+def chart_fps_by_resolution(agg: Aggregates) -> Path | None:
+    """Create grouped bar chart of FPS across resolutions for each pipeline."""
+    pivot = agg.fps_res_pipe
+    if pivot.empty:
+        print("Skipping fps_by_resolution: No Summary data")
+        return None
+
+    fig, ax = _shared_axes((12, 6))
+
+    x = np.arange(len(pivot.index))
+    width = 0.8 / len(pivot.columns)
+
+    for i, pipeline in enumerate(pivot.columns):
+        offset = (i - len(pivot.columns)/2 + 0.5) * width
+        values = pivot[pipeline].fillna(0).tolist()
+        color = get_pipeline_color(pipeline)
+        ax.bar(x + offset, values, width, label=pipeline, color=color, edgecolor='black', linewidth=0.5)
+
+    ax.set_xlabel('Resolution')
+    ax.set_ylabel('Average FPS')
+    ax.set_title('FPS by Resolution and Pipeline')
+    ax.set_xticks(x)
+    ax.set_xticklabels([str(int(r)) for r in pivot.index])
+    ax.legend(loc='upper right')
+
+    return save_chart(fig, 'fps_by_resolution', close=False, fmt='svg')
+
+
+def chart_fps_by_scene(agg: Aggregates) -> Path | None:
+    """Create grouped bar chart of FPS across scenes for each pipeline."""
+    pivot = agg.fps_scene_pipe
+    if pivot.empty:
+        print("Skipping fps_by_scene: No Summary data")
+        return None
+
+    fig, ax = _shared_axes((12, 6))
+
+    x = np.arange(len(pivot.index))
+    width = 0.8 / len(pivot.columns)
+
+    for i, pipeline in enumerate(pivot.columns):
+        offset = (i - len(pivot.columns)/2 + 0.5) * width
+        values = pivot[pipeline].fillna(0).tolist()
+        color = get_pipeline_color(pipeline)
+        ax.bar(x + offset, values, width, label=pipeline, color=color, edgecolor='black', linewidth=0.5)
+
+    ax.set_xlabel('Scene')
+    ax.set_ylabel('Average FPS')
+    ax.set_title('FPS by Scene and Pipeline')
+    ax.set_xticks(x)
+    ax.set_xticklabels(pivot.index, rotation=45, ha='right')
+    ax.legend(loc='upper right')
+
+    return save_chart(fig, 'fps_by_scene', close=False, fmt='svg')
+
+
+def chart_frame_time_distribution(agg: Aggregates) -> Path | None:
+    """Create box plot of frame time distributions."""
+    # The distribution needs the raw per-test rows, not an aggregate
+    df = agg.summary
+    if df.empty or 'frame_time_mean_ms' not in df.columns:
+        print("Skipping frame_time_distribution: No Summary data")
+        return None
+
+    # One scan: drop NaNs once, then split by pipeline via groupby
+    # (was a boolean mask + dropna per pipeline)
+    grouped = df.dropna(subset=['frame_time_mean_ms']) \
+                .groupby('pipeline', observed=True)['frame_time_mean_ms']
+    valid_data = [(p, ft.to_numpy()) for p, ft in grouped if len(ft)]
+
+    if not valid_data:
+        return None
+
+    pipelines_filtered, frame_times_filtered = zip(*valid_data)
+
+    fig, ax = _shared_axes((10, 6))
+
+    bp = ax.boxplot(frame_times_filtered, tick_labels=pipelines_filtered, patch_artist=True)
+
+    for patch, pipeline in zip(bp['boxes'], pipelines_filtered):
+        patch.set_facecolor(get_pipeline_color(pipeline))
+        patch.set_alpha(0.7)
+
+    ax.set_xlabel('Pipeline')
+    ax.set_ylabel('Frame Time (ms)')
+    ax.set_title('Frame Time Distribution by Pipeline')
+
+    return save_chart(fig, 'frame_time_distribution', close=False, fmt='svg')
+
+
+def chart_bandwidth_comparison(agg: Aggregates) -> Path | None:
+    """Create bar chart of memory bandwidth by pipeline."""
+    bw_by_pipeline = agg.bw_by_pipe
+    if bw_by_pipeline.empty:
+        print("Skipping bandwidth_comparison: No Summary data")
+        return None
+
+    fig, ax = _shared_axes((10, 6))
+
+    pipelines = bw_by_pipeline.index.tolist()
+    bandwidth = bw_by_pipeline.values.tolist()
+    colors = [get_pipeline_color(p) for p in pipelines]
+
+    bars = ax.bar(pipelines, bandwidth, color=colors, edgecolor='black', linewidth=0.5)
+
+    ax.bar_label(bars, labels=[f'{v:.1f}' for v in bandwidth], padding=3, fontsize=10)
+
+    ax.set_xlabel('Pipeline')
+    ax.set_ylabel('Average Bandwidth (GB/s)')
+    ax.set_title('Memory Bandwidth by Pipeline')
+
+    return save_chart(fig, 'bandwidth_comparison', close=False, fmt='svg')
+
+
+def chart_resolution_heatmap(agg: Aggregates) -> Path | None:
+    """Create heatmap of FPS across resolution and scene."""
+    pivot = agg.fps_scene_res
+    if pivot.empty or pivot.shape[0] < 2 or pivot.shape[1] < 2:
+        print("Skipping resolution_heatmap: Not enough data for heatmap")
+        return None
+
+    fig, ax = _shared_axes((10, 8))
+
+    im = ax.imshow(pivot.values, cmap='RdYlGn', aspect='auto')
+
+    cbar = ax.figure.colorbar(im, ax=ax)
+    cbar.ax.set_ylabel('FPS', rotation=-90, va='bottom')
+
+    ax.set_xticks(np.arange(len(pivot.columns)))
+    ax.set_yticks(np.arange(len(pivot.index)))
+    ax.set_xticklabels([str(int(c)) for c in pivot.columns])
+    ax.set_yticklabels(pivot.index)
+
+    # Format all cell labels in one vectorized pass; the loop below only
+    # places non-empty ones (per-cell .iloc + format was pure Python)
+    vals = pivot.to_numpy()
+    labels = np.where(np.isnan(vals), '', np.char.mod('%.0f', vals))
+    for (i, j), label in np.ndenumerate(labels):
+        if label:
+            ax.text(j, i, label, ha='center', va='center', color='black', fontsize=9)
+
+    ax.set_xlabel('Resolution')
+    ax.set_ylabel('Scene')
+    ax.set_title('FPS Heatmap: Resolution vs Scene')
+
+    return save_chart(fig, 'resolution_heatmap', close=False)  # raster imshow stays PNG
+
+
+def chart_cross_machine_comparison(agg: Aggregates) -> Path | None:
+    """Create grouped bar chart comparing GPUs across pipelines."""
+    df = agg.cross_machine
+    if df.empty or 'gpu_name' not in df.columns:
+        print("Skipping cross_machine: No Cross_Machine data")
+        return None
+
+    # Pivot: GPU x Pipeline -> FPS
+    pivot = df.groupby(
+        ['gpu_name', 'pipeline'], observed=True)['avg_fps'].mean().unstack('pipeline')
+
+    if pivot.empty or len(pivot.index) < 1:
+        print("Skipping cross_machine: Not enough GPUs for comparison")
+        return None
+
+    fig, ax = _shared_axes((14, 6))
+
+    x = np.arange(len(pivot.index))
+    width = 0.8 / len(pivot.columns)
+
+    for i, pipeline in enumerate(pivot.columns):
+        offset = (i - len(pivot.columns)/2 + 0.5) * width
+        values = pivot[pipeline].fillna(0).tolist()
+        color = get_pipeline_color(pipeline)
+        ax.bar(x + offset, values, width, label=pipeline, color=color, edgecolor='black', linewidth=0.5)
+
+    ax.set_xlabel('GPU')
+    ax.set_ylabel('Average FPS')
+    ax.set_title('Cross-Machine GPU Performance Comparison')
+    ax.set_xticks(x)
+    ax.set_xticklabels(pivot.index, rotation=15, ha='right')
+    ax.legend(loc='upper right')
+
+    return save_chart(fig, 'cross_machine_comparison', close=False, fmt='svg')
+
+
+def chart_gpu_scaling(agg: Aggregates) -> Path | None:
+    """Create line chart showing how each GPU scales across resolutions."""
+    # resolution x GPU -> FPS (averaged across all pipelines/scenes)
+    pivot = agg.fps_res_gpu
+    if pivot.empty or len(pivot.columns) < 1:
+        print("Skipping gpu_scaling: Could not merge Summary with Benchmarks")
+        return None
+
+    fig, ax = _shared_axes((10, 6))
+
+    for gpu in pivot.columns:
+        values = pivot[gpu].dropna()
+        ax.plot(values.index, values.values, marker='o', linewidth=2, markersize=8, label=gpu)
+
+    ax.set_xlabel('Resolution')
+    ax.set_ylabel('Average FPS')
+    ax.set_title('GPU Scaling: FPS vs Resolution')
+    ax.legend(loc='upper right')
+    ax.grid(True, alpha=0.3)
+
+    return save_chart(fig, 'gpu_scaling', close=False, fmt='svg')
+
+
+# Registry of all chart functions
+CHART_GENERATORS = {
+    'fps_by_pipeline': chart_fps_by_pipeline,
+    'frame_time_by_pipeline': chart_frame_time_by_pipeline,
+    'fps_by_resolution': chart_fps_by_resolution,
+    'fps_by_scene': chart_fps_by_scene,
+    'frame_time_distribution': chart_frame_time_distribution,
+    'bandwidth_comparison': chart_bandwidth_comparison,
+    'resolution_heatmap': chart_resolution_heatmap,
+    'cross_machine_comparison': chart_cross_machine_comparison,
+    'gpu_scaling': chart_gpu_scaling,
+}
+
+
+def _render_one(chart_name: str, agg: Aggregates) -> Path | None:
+    """Render a single chart; also the worker entry for parallel rendering.
+
+    apply_style is called here because matplotlib rcParams are
+    process-local state and each pool worker starts with the defaults.
+    """
+    apply_style()
+    try:
+        return CHART_GENERATORS[chart_name](agg)
+    except Exception as e:
+        print(f"Error generating {chart_name}: {e}")
+        return None
+
+
+def generate_all_charts(data: dict[str, pd.DataFrame], charts: list[str] | None = None) -> list[Path]:
+    """Generate all or specified charts.
+
+    Figure rendering is CPU-bound pure Python and independent per chart,
+    so multiple charts are dispatched to a process pool - wall time is
+    roughly the slowest chart instead of the sum of all of them. The
+    Aggregates payload is small (pre-reduced frames), so pickling it to
+    each worker is cheap.
+    """
+    agg = _build_aggregates(data)
+
+    charts_to_generate = []
+    for chart_name in (charts if charts else list(CHART_GENERATORS.keys())):
+        if chart_name not in CHART_GENERATORS:
+            print(f"Unknown chart: {chart_name}")
+            continue
+        charts_to_generate.append(chart_name)
+
+    if len(charts_to_generate) <= 1:
+        return [p for name in charts_to_generate if (p := _render_one(name, agg))]
+
+    generated = []
+    workers = min(len(charts_to_generate), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {name: executor.submit(_render_one, name, agg)
+                   for name in charts_to_generate}
+        for chart_name, future in futures.items():
+            print(f"Generating: {chart_name}...")
+            path = future.result()
+            if path:
+                generated.append(path)
+
+    return generated
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate charts from Excel benchmark data")
+    parser.add_argument('--input', '-i', type=Path, default=EXCEL_FILE,
+                        help=f"Input Excel file (default: {EXCEL_FILE})")
+    parser.add_argument('--charts', '-c', nargs='*',
+                        help=f"Specific charts to generate (default: all). Options: {list(CHART_GENERATORS.keys())}")
+    parser.add_argument('--list', '-l', action='store_true',
+                        help="List available chart types")
+
+    return run(parser.parse_args())
+
+
+def run(args: argparse.Namespace) -> int:
+    """Execute the CLI with a parsed namespace (in-process entry point)."""
+    if args.list:
+        print("Available charts:")
+        for name in CHART_GENERATORS.keys():
+            print(f"  - {name}")
+        return 0
+
+    if not args.input.exists():
+        print(f"Error: Excel file not found: {args.input}")
+        print("Run aggregate_results.py first to create the Excel file.")
+        return 1
+
+    data = load_excel_data(args.input)
+    if not data:
+        return 1
+
+    generated = generate_all_charts(data, args.charts)
+
+    print(f"\nGenerated {len(generated)} charts in {CHARTS_OUTPUT_DIR}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
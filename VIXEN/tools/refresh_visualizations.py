@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Master refresh script for the data visualization pipeline.
+
+Orchestrates the full pipeline:
+1. Aggregate JSON benchmark results -> Excel
+2. Generate charts from Excel -> PNG
+3. Report what was updated
+
+Usage:
+    python refresh_visualizations.py [--skip-aggregate] [--charts CHART_NAMES...]
+"""
+
+import argparse
+import functools
+import os
+from datetime import datetime
+
+from chart_config import (
+    PROJECT_ROOT, DATA_DIR, BENCHMARK_RESULTS_DIR,
+    CHARTS_OUTPUT_DIR, EXCEL_FILE
+)
+
+# Both pipeline stages run in-process: one interpreter, one set of
+# pandas/matplotlib imports, and the aggregated frames flow straight into
+# chart generation instead of round-tripping through the xlsx.
+import aggregate_results
+import generate_charts
+
+
+def _print_stage(title: str):
+    print(f"\n{'='*60}")
+    print(title)
+    print('='*60)
+
+
+@functools.lru_cache(maxsize=1)
+def _list_jsons() -> tuple[str, ...]:
+    """Benchmark JSON filenames, scanned once per run.
+
+    os.scandir is a single readdir pass (no per-entry stat), and the
+    cache means repeat callers don't rescan a directory that can hold
+    thousands of result files.
+    """
+    if not BENCHMARK_RESULTS_DIR.exists():
+        return ()
+    with os.scandir(BENCHMARK_RESULTS_DIR) as entries:
+        return tuple(e.name for e in entries if e.name.endswith('.json') and e.is_file())
+
+
+def check_prerequisites() -> list[str]:
+    """Check for required files and directories."""
+    issues = []
+
+    if not BENCHMARK_RESULTS_DIR.exists():
+        issues.append(f"Benchmark results directory not found: {BENCHMARK_RESULTS_DIR}")
+
+    if not _list_jsons():
+        issues.append(f"No JSON benchmark files found in {BENCHMARK_RESULTS_DIR}")
+
+    return issues
+
+
+def print_summary(aggregate_success: bool, charts_generated: int):
+    """Print pipeline execution summary."""
+    print("\n" + "="*60)
+    print("PIPELINE SUMMARY")
+    print("="*60)
+
+    print(f"Timestamp: {datetime.now().isoformat()}")
+    print(f"Excel file: {EXCEL_FILE}")
+    print(f"Charts directory: {CHARTS_OUTPUT_DIR}")
+    print()
+
+    if aggregate_success:
+        print("[OK] Data aggregation: SUCCESS")
+    else:
+        print("[FAIL] Data aggregation: FAILED")
+
+    print(f"[OK] Charts generated: {charts_generated}")
+
+    # List generated charts (vector charts are SVG, the heatmap is PNG)
+    if CHARTS_OUTPUT_DIR.exists():
+        charts = [c for pattern in ("*.svg", "*.png")
+                  for c in CHARTS_OUTPUT_DIR.glob(pattern)]
+        if charts:
+            print("\nGenerated charts:")
+            for chart in sorted(charts):
+                print(f"  - {chart.name}")
+
+    print("\n" + "="*60)
+    print("To embed in Obsidian, use:")
+    print("  ![[charts/fps_by_pipeline.svg]]")
+    print("="*60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh all data visualizations")
+    parser.add_argument('--skip-aggregate', action='store_true',
+                        help="Skip JSON->Excel aggregation (use existing Excel)")
+    parser.add_argument('--charts', '-c', nargs='*',
+                        help="Specific charts to generate (default: all)")
+    parser.add_argument('--check', action='store_true',
+                        help="Check prerequisites only, don't run pipeline")
+
+    args = parser.parse_args()
+
+    print("="*60)
+    print("VIXEN Data Visualization Pipeline")
+    print("="*60)
+
+    # Check prerequisites
+    issues = check_prerequisites()
+    if issues:
+        print("\nPrerequisite issues:")
+        for issue in issues:
+            print(f"  [!] {issue}")
+
+        if args.check:
+            return 1 if issues else 0
+
+        if not args.skip_aggregate:
+            print("\nCannot proceed without benchmark data.")
+            print("Run benchmarks first, or use --skip-aggregate with existing Excel file.")
+            return 1
+
+    if args.check:
+        print("\n[OK] All prerequisites met")
+        return 0
+
+    aggregate_success = True
+    charts_generated = 0
+
+    # Step 1: Aggregate results (the xlsx is still written as the
+    # shareable artifact; the frames stay in memory for step 2)
+    data = None
+    if not args.skip_aggregate:
+        _print_stage("Aggregating benchmark results")
+        data = aggregate_results.aggregate(BENCHMARK_RESULTS_DIR, EXCEL_FILE)
+        aggregate_success = data is not None
+        if not aggregate_success:
+            print("\nWarning: Aggregation failed. Attempting chart generation anyway...")
+
+    # Step 2: Generate charts, from the in-memory frames when step 1 ran
+    if data is None:
+        if not EXCEL_FILE.exists():
+            print(f"\nError: Excel file not found: {EXCEL_FILE}")
+            print("Run without --skip-aggregate to create it.")
+            return 1
+        _print_stage("Loading existing workbook")
+        data = generate_charts.load_excel_data(EXCEL_FILE)
+
+    _print_stage("Generating charts")
+    charts_generated = len(generate_charts.generate_all_charts(data, args.charts))
+
+    # Summary
+    print_summary(aggregate_success, charts_generated)
+
+    return 0 if aggregate_success and charts_generated > 0 else 1
+
+
+if __name__ == "__main__":
+    exit(main())